@@ -1,20 +1,48 @@
 #!/usr/bin/env python3
 import argparse
-import json
+import contextlib
+import functools
 import os
-import shutil
-import subprocess
+import re
+import stat
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
-from typing import Dict, Optional
+
+# copy, json, shutil, subprocess, concurrent.futures and the optional orjson
+# are imported inside the functions that use them so fast commands (list,
+# help) don't pay for them at startup. typing is avoided for the same reason;
+# type checkers treat any name TYPE_CHECKING as True.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import subprocess
+
+# Patterns used by info/bootstrap, python_version_str_fast and the pyenv lookup
+_PY_VER_RE = re.compile(r'py(\d+\.\d+)')
+_ENV_NAME_RE = re.compile(r'^(.+)-py(\d+\.\d+)$')
+_MAJOR_MINOR_RE = re.compile(r'\d+\.\d+')
+_PY_BIN_NAME_RE = re.compile(r'python(\d+\.\d+)$')
+_PYENV_VER_DIR_RE = re.compile(r'/versions/(\d+\.\d+)\.\d+/')
+_PYENV_RELEASE_RE = re.compile(r'(\d+\.\d+)\.\d+')
+
+
+@functools.lru_cache(maxsize=1)
+def _orjson():
+    """Import orjson on first use, or return None if it is not installed."""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
 
 
+@functools.lru_cache(maxsize=1)
 def script_dir() -> Path:
     """Get the directory where this script is located."""
     return Path(__file__).parent.resolve()
 
 
+@functools.lru_cache(maxsize=1)
 def data_dir() -> Path:
     """Get the data directory for venvman."""
     d = script_dir() / "data"
@@ -22,45 +50,165 @@ def data_dir() -> Path:
     return d
 
 
+@functools.lru_cache(maxsize=1)
 def projects_file() -> Path:
     """Get the path to the projects tracking JSON file."""
     return data_dir() / "projects.json"
 
 
-def load_projects() -> Dict[str, dict]:
+def load_projects() -> dict[str, dict]:
     """Load projects from JSON file.
 
     Returns:
         Dict mapping project name to project info dict containing:
         - path: project directory path
         - venv_subdir: virtual environment subdirectory name
-        - last_deps_install: ISO timestamp of last dependency installation (or null)
+        - last_deps_install: Unix timestamp of last dependency installation (or null;
+          older files may hold an ISO 8601 string)
     """
+    import json
+
     pf = projects_file()
-    if not pf.exists():
-        return {}
+    orjson = _orjson()
     try:
-        with open(pf, 'r') as f:
-            return json.load(f)
+        if orjson is not None:
+            projects = orjson.loads(pf.read_bytes())
+        else:
+            with open(pf, 'r') as f:
+                projects = json.load(f)
+    except FileNotFoundError:
+        return {}
     except json.JSONDecodeError:
         print(f"Error: {pf} contains invalid JSON", file=sys.stderr)
         sys.exit(1)
+    # save_projects writes keys sorted; re-sort once here in case the file
+    # was edited by hand, so callers can iterate without sorting
+    return dict(sorted(projects.items()))
 
 
-def save_projects(projects: Dict[str, dict]) -> None:
-    """Save projects to JSON file."""
-    with open(projects_file(), 'w') as f:
-        json.dump(projects, f, indent=2, sort_keys=True)
+def save_projects(projects: dict[str, dict]) -> None:
+    """Save projects to JSON file.
 
+    The data is written to a uniquely named temporary file in the same
+    directory, fsynced and moved into place with os.replace, so concurrent
+    saves never share a file and a crash never leaves a truncated one.
+    """
+    import json
+    import tempfile
 
+    pf = projects_file()
+    orjson = _orjson()
+    if orjson is not None:
+        data = orjson.dumps(projects, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    else:
+        data = json.dumps(projects, indent=2, sort_keys=True).encode()
+    try:
+        mode = stat.S_IMODE(os.stat(pf).st_mode)
+    except FileNotFoundError:
+        mode = 0o644
+    fd, tmp = tempfile.mkstemp(dir=pf.parent, prefix=".projects.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            # mkstemp creates the file 0600; keep the existing file's mode
+            os.fchmod(f.fileno(), mode)
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, pf)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp)
+        raise
+
+
+@contextlib.contextmanager
+def projects_transaction():
+    """
+    Load projects, yield them for modification, then save them.
+
+    Nothing is written if the body raises (including sys.exit).
+
+    Yields:
+        Dict mapping project name to project info dict (see load_projects)
+    """
+    projects = load_projects()
+    yield projects
+    save_projects(projects)
+
+
+@functools.lru_cache(maxsize=1)
 def venv_home() -> Path:
-    """Get the virtual environment home directory from $VENVMAN_DIRECTORY or default."""
-    return Path(os.environ.get("VENVMAN_DIRECTORY", str(Path.home() / "VirtualEnvironments")))
+    """Get the virtual environment home directory from $VENVMAN_DIRECTORY or default.
+
+    Cached for the life of the process: setenv/set_home only edit the shell RC
+    file for future shells and never change this process's environment.
+    """
+    directory = os.environ.get("VENVMAN_DIRECTORY")
+    if directory is None:
+        return Path.home() / "VirtualEnvironments"
+    return Path(directory)
+
+
+def run(cmd: list[str], text: bool = True) -> "subprocess.CompletedProcess":
+    """Execute a subprocess command and return the result.
+
+    Only stdout is captured. No caller reads the child's stderr, so it goes
+    to /dev/null rather than a pipe this process would have to drain. Pass
+    text=False to get stdout as raw bytes (e.g., for a path to os.fsdecode).
+    """
+    import subprocess
+    return subprocess.run(cmd, check=False, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=text)
 
 
-def run(cmd: list[str]) -> subprocess.CompletedProcess:
-    """Execute a subprocess command and return the result."""
-    return subprocess.run(cmd, check=False, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+def run_inherit(cmd: list[str]) -> "subprocess.CompletedProcess":
+    """Execute a subprocess command with output going straight to the terminal.
+
+    Used for long-running commands (venv creation, pip) whose output is only
+    shown to the user, so nothing is buffered in this process.
+    """
+    import subprocess
+    # Flush our own buffered output so it appears before the child's
+    sys.stdout.flush()
+    return subprocess.run(cmd, check=False)
+
+
+@functools.lru_cache(maxsize=None)
+def _which(name: str) -> str | None:
+    """Memoized shutil.which; each lookup otherwise rescans $PATH."""
+    import shutil
+    return shutil.which(name)
+
+
+def _pyenv_python(pyver: str) -> Path | None:
+    """
+    Look up python<pyver> among pyenv's installed CPython releases.
+
+    Reads $PYENV_ROOT/versions directly instead of running `pyenv which`;
+    the newest X.Y.Z install providing the interpreter wins.
+
+    Args:
+        pyver: Python version string (e.g., "3.12")
+
+    Returns:
+        Path to Python interpreter or None if no matching install was found
+    """
+    root = os.environ.get("PYENV_ROOT") or os.path.join(os.path.expanduser("~"), ".pyenv")
+    versions = os.path.join(root, "versions")
+    best = None
+    try:
+        with os.scandir(versions) as it:
+            for entry in it:
+                match = _PYENV_RELEASE_RE.fullmatch(entry.name)
+                if not match or match.group(1) != pyver:
+                    continue
+                key = tuple(int(n) for n in entry.name.split("."))
+                if best is None or key > best[0]:
+                    cand = os.path.join(entry.path, "bin", f"python{pyver}")
+                    if os.path.exists(cand):
+                        best = (key, cand)
+    except OSError:
+        return None
+    return Path(best[1]) if best else None
 
 
 def find_python(pyver: str | None) -> Path | None:
@@ -68,22 +216,43 @@ def find_python(pyver: str | None) -> Path | None:
     Find a suitable Python interpreter with priority-based resolution.
 
     Priority:
-    1. pyenv (if available and version specified)
+    1. pyenv (if installed and version specified)
     2. System python<version> (if version specified)
     3. Fallback to python3 (only if no specific version requested)
 
+    Results are cached per (pyver, $PATH, $PYENV_ROOT, $HOME), the inputs
+    that determine the answer, so a change to any of them gets a fresh lookup.
+
     Args:
         pyver: Python version string (e.g., "3.12") or None
 
     Returns:
         Path to Python interpreter or None if not found
     """
-    # Try pyenv first if version specified
+    env = os.environ
+    return _find_python(pyver, env.get("PATH", ""), env.get("PYENV_ROOT", ""), env.get("HOME", ""))
+
+
+@functools.lru_cache(maxsize=8)
+def _find_python(pyver: str | None, path_env: str, pyenv_root: str, home: str) -> Path | None:
+    """
+    Uncached body of find_python; the environment arguments only key the cache.
+
+    Uses shutil.which directly rather than _which, whose cache is keyed on the
+    name alone and would return a stale hit after $PATH changes.
+    """
+    import shutil
+
+    # Try pyenv first if version specified: its versions directory needs no
+    # PATH lookup, the `pyenv which` subprocess only runs if pyenv is on PATH
     if pyver:
+        p = _pyenv_python(pyver)
+        if p is not None:
+            return p
         if shutil.which("pyenv"):
-            r = run(["pyenv", "which", f"python{pyver}"])
+            r = run(["pyenv", "which", f"python{pyver}"], text=False)
             if r.returncode == 0:
-                p = Path(r.stdout.strip())
+                p = Path(os.fsdecode(r.stdout.strip()))
                 if p.exists():
                     return p
         # Then system python<ver>
@@ -119,13 +288,104 @@ def python_version_str(python_bin: Path) -> str:
     return r.stdout.strip()
 
 
+def python_version_str_fast(python_bin: Path, hint: str | None = None) -> str:
+    """
+    Determine MAJOR.MINOR version of a Python interpreter without running it when possible.
+
+    The version is taken, in order, from the requested version hint, the
+    interpreter filename (e.g., python3.12) of the given path or its resolved
+    symlink target, a pyenv versions/X.Y.Z directory in either path, or a
+    single lib/pythonX.Y/os.py under the interpreter's prefix. Falls back
+    to python_version_str() if none of these yield a version.
+
+    Args:
+        python_bin: Path to Python interpreter
+        hint: Version requested by the user (e.g., "3.12") or None
+
+    Returns:
+        Version string in format "MAJOR.MINOR" (e.g., "3.12")
+    """
+    if hint and _MAJOR_MINOR_RE.fullmatch(hint):
+        return hint
+    # Generic names like /usr/bin/python3 are usually symlinks to pythonX.Y
+    path = str(python_bin)
+    real = os.path.realpath(path)
+    cands = (path, real) if real != path else (path,)
+    # A pythonX.Y filename on either path beats a versions/X.Y.Z directory
+    for cand in cands:
+        match = _PY_BIN_NAME_RE.search(os.path.basename(cand))
+        if match:
+            return match.group(1)
+    for cand in cands:
+        match = _PYENV_VER_DIR_RE.search(cand)
+        if match:
+            return match.group(1)
+    # Like CPython's own prefix search, look for the stdlib landmark
+    # <prefix>/lib/pythonX.Y/os.py beside the real bin directory
+    lib = os.path.join(os.path.dirname(os.path.dirname(real)), "lib")
+    found = []
+    try:
+        with os.scandir(lib) as it:
+            for entry in it:
+                match = _PY_BIN_NAME_RE.fullmatch(entry.name)
+                if match and os.path.isfile(os.path.join(entry.path, "os.py")):
+                    found.append(match.group(1))
+    except OSError:
+        pass
+    if len(found) == 1:
+        return found[0]
+    return python_version_str(python_bin)
+
+
+def env_dir_names(root: Path) -> list[str]:
+    """
+    Get the names of the environment directories directly under root.
+
+    Uses os.scandir so the directory check comes from readdir's cached entry
+    type instead of a stat per child.
+
+    Args:
+        root: Directory to scan
+
+    Returns:
+        Unsorted list of subdirectory names (empty if root does not exist)
+    """
+    try:
+        with os.scandir(root) as it:
+            return [e.name for e in it if e.is_dir()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def _find_project_envs(root: Path, project: str) -> list[str]:
+    """
+    Get the names of environments under root that belong to a project.
+
+    Matches <project>-py* with a literal prefix test in one scandir pass,
+    so glob metacharacters in the project name are taken literally.
+
+    Args:
+        root: Directory to scan
+        project: Project name
+
+    Returns:
+        Sorted list of matching environment names (empty if root does not exist)
+    """
+    prefix = f"{project}-py"
+    try:
+        with os.scandir(root) as it:
+            names = [e.name for e in it if e.name.startswith(prefix) and e.is_dir()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    names.sort()
+    return names
+
+
 def list_envs(args):
     """List all virtual environments in $VENVMAN_DIRECTORY."""
-    root = venv_home()
-    if not root.exists():
-        return
-    for p in sorted([d for d in root.iterdir() if d.is_dir()]):
-        print(p.name)
+    names = env_dir_names(venv_home())
+    names.sort()
+    sys.stdout.write("".join(f"{name}\n" for name in names))
 
 
 def ensure_symlink(link: Path, target: Path, force: bool):
@@ -140,44 +400,45 @@ def ensure_symlink(link: Path, target: Path, force: bool):
     Raises:
         SystemExit: If .venv exists but is not a symlink and force=False
     """
-    if link.exists() or link.is_symlink():
-        if link.is_symlink():
-            if link.resolve() == target.resolve():
+    # One lstat answers both "does it exist" and "is it a symlink"
+    target_str = os.fspath(target)
+    try:
+        st = os.lstat(link)
+    except FileNotFoundError:
+        os.symlink(target_str, link)
+        return
+    if stat.S_ISLNK(st.st_mode):
+        # readlink is a single syscall; only canonicalize both paths
+        # (e.g. for a relative link) when the raw text differs
+        try:
+            if (os.readlink(link) == target_str
+                    or os.path.realpath(link) == os.path.realpath(target_str)):
                 return
-        if not force:
-            # Check if it's a regular directory/file (not a symlink)
-            if link.exists() and not link.is_symlink():
-                print(f"Error: {link} exists but is not a symlink.", file=sys.stderr)
-                print(f"Use --force to replace it.", file=sys.stderr)
-                sys.exit(1)
-            # Replace symlink by default (safe behavior)
-            link.unlink(missing_ok=True)
-        else:
-            link.unlink(missing_ok=True)
-    link.symlink_to(target)
-
-
-def write_activate_sh(repo_dir: Path, venv_subdir: str):
-    """
-    Generate activate.sh script in the project directory.
+        except OSError:
+            pass
+    elif not force:
+        print(f"Error: {link} exists but is not a symlink.", file=sys.stderr)
+        print(f"Use --force to replace it.", file=sys.stderr)
+        sys.exit(1)
+    # Replace the stale symlink (safe behavior), or with --force whatever is there
+    try:
+        os.unlink(link)
+    except FileNotFoundError:
+        pass
+    os.symlink(target_str, link)
 
-    The script uses VIRTUAL_ENVIRONMENT_DIRECTORY env var to find the venv root,
-    and handles dependencies.yaml for adding paths to PYTHONPATH.
 
-    Args:
-        repo_dir: Path to the project directory
-        venv_subdir: Name of the virtual environment subdirectory (e.g., "myproject-py3.12")
-    """
-    script = repo_dir / "activate.sh"
-    script_content = f'''#!/usr/bin/env bash
+# Body of the generated activate.sh, encoded once at import; write_activate_sh
+# substitutes the __VENV_SUBDIR__ marker, so shell braces need no escaping.
+_ACTIVATE_SH_TEMPLATE = b'''#!/usr/bin/env bash
 # Source this file to activate the project environment.
 # Generated by venvman - https://github.com/cshenry/EnvironmentManager
 
 # Get the directory containing this script
-SCRIPT_DIR="$(cd "$(dirname "${{BASH_SOURCE[0]}}")" && pwd)"
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 
 # Check for VIRTUAL_ENVIRONMENT_DIRECTORY
-if [ -z "${{VIRTUAL_ENVIRONMENT_DIRECTORY:-}}" ]; then
+if [ -z "${VIRTUAL_ENVIRONMENT_DIRECTORY:-}" ]; then
   echo "Error: VIRTUAL_ENVIRONMENT_DIRECTORY is not set." >&2
   echo "" >&2
   echo "This environment variable must point to your virtual environments root directory." >&2
@@ -188,8 +449,8 @@ if [ -z "${{VIRTUAL_ENVIRONMENT_DIRECTORY:-}}" ]; then
   return 1 2>/dev/null || exit 1
 fi
 
-VENV_SUBDIR="{venv_subdir}"
-VENV_PATH="${{VIRTUAL_ENVIRONMENT_DIRECTORY}}/${{VENV_SUBDIR}}"
+VENV_SUBDIR="__VENV_SUBDIR__"
+VENV_PATH="${VIRTUAL_ENVIRONMENT_DIRECTORY}/${VENV_SUBDIR}"
 
 if [ ! -f "$VENV_PATH/bin/activate" ]; then
   echo "Error: $VENV_PATH/bin/activate not found." >&2
@@ -202,7 +463,7 @@ source "$VENV_PATH/bin/activate"
 echo "Activated $VENV_PATH"
 
 # Handle dependencies.yaml if present
-DEPS_FILE="${{SCRIPT_DIR}}/dependencies.yaml"
+DEPS_FILE="${SCRIPT_DIR}/dependencies.yaml"
 if [ -f "$DEPS_FILE" ]; then
   # Extract paths from dependencies.yaml and add to PYTHONPATH
   # Parse YAML path: lines using grep and sed
@@ -213,12 +474,12 @@ if [ -f "$DEPS_FILE" ]; then
     if [ -n "$dep_path" ]; then
       # If path is relative (doesn't start with /), prepend SCRIPT_DIR
       if [[ "$dep_path" != /* ]]; then
-        dep_path="${{SCRIPT_DIR}}/${{dep_path}}"
+        dep_path="${SCRIPT_DIR}/${dep_path}"
       fi
       # Resolve to absolute path
       if [ -d "$dep_path" ]; then
         dep_path="$(cd "$dep_path" && pwd)"
-        export PYTHONPATH="${{PYTHONPATH:+$PYTHONPATH:}}$dep_path"
+        export PYTHONPATH="${PYTHONPATH:+$PYTHONPATH:}$dep_path"
         echo "Added to PYTHONPATH: $dep_path"
       else
         echo "Warning: Dependency path not found: $dep_path" >&2
@@ -227,8 +488,48 @@ if [ -f "$DEPS_FILE" ]; then
   done
 fi
 '''
-    script.write_text(script_content)
-    script.chmod(0o755)
+
+
+def write_activate_sh(repo_dir: str | Path, venv_subdir: str) -> bool:
+    """
+    Generate activate.sh script in the project directory.
+
+    The script uses VIRTUAL_ENVIRONMENT_DIRECTORY env var to find the venv root,
+    and handles dependencies.yaml for adding paths to PYTHONPATH.
+
+    Args:
+        repo_dir: Path to the project directory
+        venv_subdir: Name of the virtual environment subdirectory (e.g., "myproject-py3.12")
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    script = os.path.join(repo_dir, "activate.sh")
+    script_content = _ACTIVATE_SH_TEMPLATE.replace(b"__VENV_SUBDIR__", os.fsencode(venv_subdir))
+    # Skip the write and chmod when regenerating an identical script; the
+    # size and mode from fstat rule most changes out before reading anything
+    try:
+        with open(script, 'rb') as f:
+            st = os.fstat(f.fileno())
+            if (st.st_size == len(script_content) and st.st_mode & 0o777 == 0o755
+                    and f.read() == script_content):
+                return False
+    except OSError:
+        pass
+    fd = os.open(script, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+    try:
+        # The create mode is masked by umask and ignored for an existing file
+        os.fchmod(fd, 0o755)
+        view = memoryview(script_content)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    return True
+
+
+# Skip pip's network check for a newer pip on every install
+_PIP_INSTALL_OPTS = ("--disable-pip-version-check",)
 
 
 def install_dependencies(env_dir: Path, repo_dir: Path):
@@ -243,32 +544,30 @@ def install_dependencies(env_dir: Path, repo_dir: Path):
     requirements_file = repo_dir / "requirements.txt"
     pyproject_file = repo_dir / "pyproject.toml"
 
-    installed_any = False
-
-    # Install from requirements.txt
+    # One pip run covers both sources, paying interpreter/resolver startup once
+    cmd = [str(pip_bin), "install", *_PIP_INSTALL_OPTS]
+    sources = []
     if requirements_file.exists():
         print(f"\nInstalling dependencies from {requirements_file}...")
-        r = run([str(pip_bin), "install", "-r", str(requirements_file)])
-        if r.returncode == 0:
-            print("Successfully installed dependencies from requirements.txt")
-            installed_any = True
-        else:
-            print(f"WARNING: Failed to install from requirements.txt", file=sys.stderr)
-            print(r.stderr, file=sys.stderr)
-
-    # Install from pyproject.toml (editable install)
+        cmd += ["-r", str(requirements_file)]
+        sources.append("requirements.txt")
     if pyproject_file.exists():
         print(f"\nInstalling project from {pyproject_file} (editable mode)...")
-        r = run([str(pip_bin), "install", "-e", str(repo_dir)])
-        if r.returncode == 0:
-            print("Successfully installed project in editable mode")
-            installed_any = True
-        else:
-            print(f"WARNING: Failed to install from pyproject.toml", file=sys.stderr)
-            print(r.stderr, file=sys.stderr)
+        cmd += ["-e", str(repo_dir)]
+        sources.append("pyproject.toml")
 
-    if not installed_any:
+    if not sources:
         print("\nNo dependency files found (requirements.txt or pyproject.toml)")
+        return
+
+    r = run_inherit(cmd)
+    if r.returncode == 0:
+        if "requirements.txt" in sources:
+            print("Successfully installed dependencies from requirements.txt")
+        if "pyproject.toml" in sources:
+            print("Successfully installed project in editable mode")
+    else:
+        print(f"WARNING: Failed to install from {' and '.join(sources)}", file=sys.stderr)
 
 
 def create_env(args):
@@ -296,7 +595,7 @@ def create_env(args):
             print("No suitable python interpreter found.", file=sys.stderr)
         sys.exit(1)
 
-    ver = python_version_str(py)
+    ver = python_version_str_fast(py, args.python)
     venv_subdir = f"{args.project}-py{ver}"
     env_dir = root / venv_subdir
 
@@ -305,22 +604,24 @@ def create_env(args):
         print(f"Env exists: {env_dir}")
     else:
         print(f"Creating venv: {env_dir} using {py}")
-        r = run([str(py), "-m", "venv", str(env_dir)])
+        r = run_inherit([str(py), "-m", "venv", str(env_dir)])
         if r.returncode != 0:
-            print(r.stderr, file=sys.stderr)
+            print(f"Error: Failed to create venv at {env_dir}", file=sys.stderr)
             sys.exit(1)
 
     # Write/refresh activate.sh (uses env var for portability)
-    write_activate_sh(repo_dir, venv_subdir)
-    print(f"Wrote {repo_dir / 'activate.sh'} (source this to activate)")
+    if write_activate_sh(repo_dir, venv_subdir):
+        print(f"Wrote {repo_dir / 'activate.sh'} (source this to activate)")
+    else:
+        print(f"{repo_dir / 'activate.sh'} is up to date (source this to activate)")
 
     # Track last_deps_install timestamp
-    last_deps_install: Optional[str] = None
+    last_deps_install: float | None = None
 
     # Install dependencies if requested
     if args.install_deps:
         install_dependencies(env_dir, repo_dir)
-        last_deps_install = datetime.now().isoformat()
+        last_deps_install = time.time()
 
     # Track this project
     projects = load_projects()
@@ -333,6 +634,84 @@ def create_env(args):
     print(f"Tracking project '{args.project}'")
 
 
+# Below this many files the thread pool costs more than it saves
+_PARALLEL_UNLINK_MIN = 256
+
+
+def _unlink_all(paths: list[str]) -> None:
+    """Unlink each path in turn."""
+    for p in paths:
+        os.unlink(p)
+
+
+def _parallel_rmtree(path: Path) -> None:
+    """
+    Remove a directory tree, unlinking files from a thread pool.
+
+    Deletion of a venv's many small files is syscall-bound, so the unlinks
+    are issued concurrently before directories are removed bottom-up. Falls
+    back to shutil.rmtree if anything goes wrong (e.g. on network filesystems).
+
+    Args:
+        path: Directory to remove
+    """
+    import shutil
+    from concurrent.futures import ThreadPoolExecutor
+
+    if os.path.islink(path):
+        # Let shutil.rmtree raise its usual error rather than emptying the target
+        shutil.rmtree(path)
+        return
+    try:
+        files = []
+        dirs = [str(path)]
+        i = 0
+        while i < len(dirs):
+            with os.scandir(dirs[i]) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.path)
+                    else:
+                        files.append(entry.path)
+            i += 1
+        if len(files) < _PARALLEL_UNLINK_MIN:
+            _unlink_all(files)
+        else:
+            # One strided slice per worker rather than one future per file
+            workers = 8
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                list(ex.map(_unlink_all, (files[w::workers] for w in range(workers))))
+        # dirs is in breadth-first order, so reversed() visits children first
+        for d in reversed(dirs):
+            os.rmdir(d)
+    except OSError:
+        shutil.rmtree(path)
+
+
+def confirm(prompt: str, assume_yes: bool = False) -> bool:
+    """
+    Ask a yes/no question on stdin.
+
+    Args:
+        prompt: Question to display
+        assume_yes: If True, answer yes without prompting (--yes)
+
+    Returns:
+        True if the answer was y/yes
+
+    Raises:
+        SystemExit: If stdin is closed before an answer is given
+    """
+    if assume_yes:
+        return True
+    try:
+        response = input(prompt)
+    except EOFError:
+        print("\nError: no answer on stdin; pass --yes to skip confirmation.", file=sys.stderr)
+        sys.exit(1)
+    return response.strip().lower() in ('y', 'yes')
+
+
 def delete_env(args):
     """
     Delete a virtual environment from $VENVMAN_DIRECTORY.
@@ -347,20 +726,19 @@ def delete_env(args):
         env_dir = root / args.env
     elif args.project:
         # Search for matching environments
-        pattern = f"{args.project}-py*"
-        matches = list(root.glob(pattern)) if root.exists() else []
+        matches = _find_project_envs(root, args.project)
 
         if len(matches) == 0:
             print(f"No environments found for project: {args.project}", file=sys.stderr)
             sys.exit(1)
         elif len(matches) > 1:
             print(f"Multiple environments found for project '{args.project}':", file=sys.stderr)
-            for m in matches:
-                print(f"  - {m.name}", file=sys.stderr)
+            for name in matches:
+                print(f"  - {name}", file=sys.stderr)
             print("Please specify --env with the exact environment name.", file=sys.stderr)
             sys.exit(1)
         else:
-            env_dir = matches[0]
+            env_dir = root / matches[0]
     else:
         print("Error: Must specify either --project or --env", file=sys.stderr)
         sys.exit(1)
@@ -373,15 +751,13 @@ def delete_env(args):
     # Warn and confirm
     print(f"WARNING: About to delete: {env_dir}")
     print("Note: Symlinks in project directories will NOT be automatically removed.")
-    response = input("Continue? (y/n): ").strip().lower()
-
-    if response != 'y' and response != 'yes':
+    if not confirm("Continue? (y/n): ", args.yes):
         print("Deletion cancelled.")
         sys.exit(0)
 
     # Delete the environment
     try:
-        shutil.rmtree(env_dir)
+        _parallel_rmtree(env_dir)
         print(f"Successfully deleted: {env_dir}")
     except PermissionError as e:
         print(f"Permission error while deleting environment: {e}", file=sys.stderr)
@@ -391,6 +767,87 @@ def delete_env(args):
         sys.exit(1)
 
 
+def _file_size(entry: os.DirEntry, links: dict[tuple[int, int], int]) -> int:
+    """
+    Size of a regular file entry, deferring multiply-linked files to links.
+
+    Files with st_nlink > 1 are recorded in links keyed by (st_dev, st_ino)
+    and contribute 0 here, so each inode is counted once when links is summed.
+    """
+    st = entry.stat(follow_symlinks=False)
+    if st.st_nlink > 1:
+        links[(st.st_dev, st.st_ino)] = st.st_size
+        return 0
+    return st.st_size
+
+
+_HAVE_FWALK = hasattr(os, "fwalk")
+
+
+def _fwalk_size(path: str, links: dict[tuple[int, int], int]) -> int:
+    """
+    POSIX variant of _scan_size built on os.fwalk.
+
+    Each file is stat'ed relative to its directory's open fd (fstatat), so
+    the kernel does not re-resolve the full path for every file.
+    """
+    total = 0
+    for _, _, filenames, dirfd in os.fwalk(path):
+        for name in filenames:
+            try:
+                st = os.stat(name, dir_fd=dirfd, follow_symlinks=False)
+            except OSError:
+                continue
+            if not stat.S_ISREG(st.st_mode):
+                continue
+            if st.st_nlink > 1:
+                links[(st.st_dev, st.st_ino)] = st.st_size
+            else:
+                total += st.st_size
+    return total
+
+
+def _scan_size(path: str, links: dict[tuple[int, int], int]) -> int:
+    """
+    Sum file sizes under path with an explicit os.scandir stack.
+
+    DirEntry reuses readdir type data, avoiding a Path object and a separate
+    is_file() stat per entry. Like du, symlinks are not followed; hardlinked
+    files go to links (see _file_size). Unreadable directories and entries
+    are skipped. Delegates to _fwalk_size where os.fwalk exists.
+
+    Args:
+        path: Directory to walk
+        links: Collects sizes of multiply-linked files by (st_dev, st_ino)
+
+    Returns:
+        Total size in bytes of singly-linked files
+    """
+    if _HAVE_FWALK:
+        return _fwalk_size(path, links)
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total += _file_size(entry, links)
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+    return total
+
+
+# get_dir_size expands up to this many levels looking for this many subtrees
+_SIZE_SPLIT_MAX_DEPTH = 5
+_SIZE_SPLIT_MIN_DIRS = 16
+
+
 def get_dir_size(path: Path) -> int:
     """
     Calculate total size of a directory recursively.
@@ -401,14 +858,63 @@ def get_dir_size(path: Path) -> int:
     Returns:
         Total size in bytes
     """
+    # du is implemented in C and is the fastest option where available. -D
+    # follows path itself when it is a symlinked environment, as the scandir
+    # fallback does. -b and -D are GNU-only, so BSD/macOS du exits non-zero
+    # and we fall through. Output is read as bytes because du echoes the
+    # path, which need not be valid in the locale encoding.
+    if sys.platform != "win32" and _which("du"):
+        r = run(["du", "-sbD", str(path)], text=False)
+        if r.returncode == 0:
+            try:
+                return int(r.stdout.split()[0])
+            except (IndexError, ValueError):
+                pass
+
+    # A venv's top level is just bin/include/lib with nearly everything under
+    # lib/pythonX.Y/site-packages, so expand breadth-first until there are
+    # enough subtrees to spread over the threads. Files met on the way are
+    # counted here; each frontier directory is then walked by one thread,
+    # where scandir/stat release the GIL and hide their latency.
     total = 0
-    try:
-        for entry in path.rglob('*'):
-            if entry.is_file():
-                total += entry.stat().st_size
-    except Exception:
-        pass
-    return total
+    links: dict[tuple[int, int], int] = {}
+    subdirs = [str(path)]
+    for _ in range(_SIZE_SPLIT_MAX_DEPTH):
+        if not subdirs or len(subdirs) >= _SIZE_SPLIT_MIN_DIRS:
+            break
+        level, subdirs = subdirs, []
+        for d in level:
+            try:
+                with os.scandir(d) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                subdirs.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                total += _file_size(entry, links)
+                        except OSError:
+                            pass
+            except OSError:
+                pass
+
+    if len(subdirs) <= 1:
+        for d in subdirs:
+            total += _scan_size(d, links)
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+
+        def walk(d: str) -> tuple[int, dict[tuple[int, int], int]]:
+            sub_links: dict[tuple[int, int], int] = {}
+            return _scan_size(d, sub_links), sub_links
+
+        with ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 4) * 2)) as ex:
+            for sub_total, sub_links in ex.map(walk, subdirs):
+                total += sub_total
+                links.update(sub_links)
+    return total + sum(links.values())
+
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
 
 
 def format_size(size_bytes: int) -> str:
@@ -421,11 +927,29 @@ def format_size(size_bytes: int) -> str:
     Returns:
         Formatted string (e.g., "1.5 MB")
     """
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB"
+    if size_bytes <= 0:
+        return "0.0 B"
+    unit = min(len(_SIZE_UNITS) - 1, (size_bytes.bit_length() - 1) // 10)
+    return f"{size_bytes / (1 << (10 * unit)):.1f} {_SIZE_UNITS[unit]}"
+
+
+def format_timestamp(value) -> str:
+    """
+    Format a stored timestamp for display.
+
+    Args:
+        value: Unix timestamp (float), or an ISO 8601 string written by older versions
+
+    Returns:
+        Formatted string (e.g., "2025-10-21 14:30:00")
+    """
+    if isinstance(value, str):
+        from datetime import datetime
+        try:
+            return datetime.fromisoformat(value).strftime('%Y-%m-%d %H:%M:%S')
+        except ValueError:
+            return value
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(value))
 
 
 def info_env(args):
@@ -441,20 +965,19 @@ def info_env(args):
     if args.env:
         env_dir = root / args.env
     elif args.project:
-        pattern = f"{args.project}-py*"
-        matches = list(root.glob(pattern)) if root.exists() else []
+        matches = _find_project_envs(root, args.project)
 
         if len(matches) == 0:
             print(f"No environments found for project: {args.project}", file=sys.stderr)
             sys.exit(1)
         elif len(matches) > 1:
             print(f"Multiple environments found for project '{args.project}':", file=sys.stderr)
-            for m in matches:
-                print(f"  - {m.name}", file=sys.stderr)
+            for name in matches:
+                print(f"  - {name}", file=sys.stderr)
             print("Please specify --env with the exact environment name.", file=sys.stderr)
             sys.exit(1)
         else:
-            env_dir = matches[0]
+            env_dir = root / matches[0]
     else:
         print("Error: Must specify either --project or --env", file=sys.stderr)
         sys.exit(1)
@@ -464,42 +987,46 @@ def info_env(args):
         print(f"Environment does not exist: {env_dir}", file=sys.stderr)
         sys.exit(1)
 
-    # Display information
-    print(f"Environment: {env_dir.name}")
-    print(f"Path:        {env_dir}")
+    # Display information (collected and written in one call)
+    out = []
+    out.append(f"Environment: {env_dir.name}\n")
+    out.append(f"Path:        {env_dir}\n")
 
     # Extract Python version from name
-    import re
-    match = re.search(r'py(\d+\.\d+)', env_dir.name)
+    match = _PY_VER_RE.search(env_dir.name)
     if match:
-        print(f"Python:      {match.group(1)}")
+        out.append(f"Python:      {match.group(1)}\n")
 
     # Try to read interpreter path from pyvenv.cfg
-    pyvenv_cfg = env_dir / "pyvenv.cfg"
-    if pyvenv_cfg.exists():
-        try:
-            content = pyvenv_cfg.read_text()
-            for line in content.split('\n'):
+    try:
+        with open(os.path.join(env_dir, "pyvenv.cfg"), 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
                 if line.startswith('home = '):
-                    home = line.split('=', 1)[1].strip()
-                    print(f"Interpreter: {home}")
+                    out.append(f"Interpreter: {line[7:].strip()}\n")
                     break
-        except Exception:
-            pass
+    except OSError:
+        pass
 
     # Calculate size
     size_bytes = get_dir_size(env_dir)
-    print(f"Size:        {format_size(size_bytes)}")
+    out.append(f"Size:        {format_size(size_bytes)}\n")
 
     # Get creation date
     try:
-        import time
         ctime = env_dir.stat().st_ctime
         created = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(ctime))
-        print(f"Created:     {created}")
+        out.append(f"Created:     {created}\n")
     except Exception:
         pass
 
+    sys.stdout.write("".join(out))
+
+
+@functools.lru_cache(maxsize=None)
+def _export_line_re(var_name: str) -> re.Pattern:
+    """Compiled pattern matching an `export <var_name>=...` line in a shell RC file."""
+    return re.compile(rf'^[ \t]*export {re.escape(var_name)}=.*$', re.M)
+
 
 def update_shell_rc(var_name: str, new_directory: str) -> bool:
     """
@@ -512,6 +1039,8 @@ def update_shell_rc(var_name: str, new_directory: str) -> bool:
     Returns:
         True if successful, False otherwise
     """
+    import tempfile
+
     home = Path.home()
     rc_files = [home / ".bash_profile", home / ".bashrc"]
 
@@ -526,39 +1055,115 @@ def update_shell_rc(var_name: str, new_directory: str) -> bool:
         target_rc = rc_files[0]  # Default to .bash_profile
 
     # Read existing content
-    if target_rc.exists():
-        content = target_rc.read_text()
-        lines = content.split('\n')
-    else:
-        lines = []
+    content = target_rc.read_text() if target_rc.exists() else ''
 
-    # Check if the variable is already set and update/add it
+    # Replace the first existing export of the variable in one pass, or append it
     export_line = f'export {var_name}="{new_directory}"'
-    found = False
-
-    for i, line in enumerate(lines):
-        if line.strip().startswith(f'export {var_name}='):
-            lines[i] = export_line
-            found = True
-            break
-
+    content, found = _export_line_re(var_name).subn(lambda m: export_line, content, count=1)
     if not found:
-        # Add it at the end
-        if lines and lines[-1] != '':
-            lines.append('')
-        lines.append(f'# venvman: {var_name}')
-        lines.append(export_line)
-
-    # Write back
+        block = f'# venvman: {var_name}\n{export_line}\n'
+        if not content:
+            content = block
+        elif content.endswith('\n'):
+            content = f'{content}\n{block}'
+        else:
+            content = f'{content}\n\n{block}'
+
+    # Write to a temporary file and rename over the original so a failed
+    # write can't leave a truncated RC file. Resolve symlinks first so a
+    # symlinked dotfile is updated in place rather than replaced.
+    # mkstemp picks a unique name and creates the file 0600, so a private RC
+    # file is never readable by others while the new content is written; the
+    # original's mode is applied before any content goes in.
+    real_rc = os.path.realpath(target_rc)
+    tmp = None
     try:
-        target_rc.write_text('\n'.join(lines))
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(real_rc),
+                                   prefix=os.path.basename(real_rc) + ".", suffix=".venvman.tmp")
+        with os.fdopen(fd, 'w') as f:
+            with contextlib.suppress(FileNotFoundError):
+                os.fchmod(f.fileno(), stat.S_IMODE(os.stat(real_rc).st_mode))
+            f.write(content)
+        os.replace(tmp, real_rc)
         print(f"Updated {target_rc}")
         return True
     except Exception as e:
+        if tmp is not None:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(tmp)
         print(f"Error updating {target_rc}: {e}", file=sys.stderr)
         return False
 
 
+# ioctl request number for FICLONE (share all extents of a file on Btrfs/XFS)
+_FICLONE = 0x40049409
+
+
+def _clone_file(src: str, dst: str, *, follow_symlinks: bool = True) -> str:
+    """
+    shutil.copytree copy_function that avoids copying bytes through userspace.
+
+    On Linux, tries a FICLONE reflink (CoW filesystems), then
+    os.copy_file_range (in-kernel, server-side on NFS); otherwise, or if both
+    fail, falls back to shutil.copy2.
+    """
+    import shutil
+
+    if sys.platform.startswith("linux"):
+        try:
+            import fcntl
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                try:
+                    fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+                except OSError:
+                    remaining = os.fstat(fsrc.fileno()).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+            shutil.copystat(src, dst, follow_symlinks=follow_symlinks)
+            return dst
+        except (OSError, AttributeError):
+            pass
+    return shutil.copy2(src, dst, follow_symlinks=follow_symlinks)
+
+
+def copy_env(src: Path, dest: Path, move: bool = False) -> bool:
+    """
+    Copy (or with move=True, rename) a virtual environment tree.
+
+    Copies use _clone_file, which reflinks or copies in the kernel where
+    supported, and leave src intact. With move=True the directory is renamed
+    when src and dest share a filesystem, which is instant but removes the
+    original; otherwise it is copied. Absolute paths baked into pyvenv.cfg
+    and script shebangs are not rewritten in either case.
+
+    Args:
+        src: Environment directory to migrate
+        dest: Destination path (must not exist)
+        move: If True, rename instead of copying where possible
+
+    Returns:
+        True if src was renamed (it no longer exists), False if it was copied
+    """
+    import shutil
+
+    if move:
+        try:
+            os.rename(src, dest)
+            return True
+        except OSError:
+            pass
+
+    try:
+        shutil.copytree(src, dest, symlinks=True, copy_function=_clone_file)
+    except BaseException:
+        shutil.rmtree(dest, ignore_errors=True)
+        raise
+    return False
+
+
 def set_home(args):
     """
     Set the VENVMAN_DIRECTORY environment variable and migrate existing environments.
@@ -566,6 +1171,8 @@ def set_home(args):
     Args:
         args: Parsed command-line arguments
     """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
     new_dir = Path(args.directory).expanduser().resolve()
     current_dir = venv_home()
 
@@ -578,42 +1185,56 @@ def set_home(args):
         sys.exit(0)
 
     # Check if there are environments in the current location
-    environments_to_migrate = []
-    if current_dir.exists() and current_dir.is_dir():
-        environments_to_migrate = [d for d in current_dir.iterdir() if d.is_dir()]
+    environments_to_migrate = [current_dir / name for name in env_dir_names(current_dir)]
 
     if environments_to_migrate:
         print(f"\nFound {len(environments_to_migrate)} environment(s) in current location:")
         for env in environments_to_migrate:
             print(f"  - {env.name}")
 
-        response = input("\nMigrate these environments to the new location? (y/n): ").strip().lower()
-        if response == 'y' or response == 'yes':
+        if confirm("\nMigrate these environments to the new location? (y/n): ", args.yes):
             # Create new directory if it doesn't exist
             new_dir.mkdir(parents=True, exist_ok=True)
 
             # Migrate each environment
             print("\nMigrating environments...")
-            for env in environments_to_migrate:
-                dest = new_dir / env.name
-                if dest.exists():
-                    print(f"  Skipping {env.name} (already exists in destination)")
-                else:
+            # Each tree is independent and I/O-bound, so migrate them concurrently
+            copied = []
+            moved = []
+            with ThreadPoolExecutor(max_workers=min(8, len(environments_to_migrate))) as ex:
+                futures = {}
+                for env in environments_to_migrate:
+                    dest = new_dir / env.name
+                    if dest.exists():
+                        print(f"  Skipping {env.name} (already exists in destination)")
+                    else:
+                        futures[ex.submit(copy_env, env, dest, args.move)] = env
+                for fut in as_completed(futures):
+                    env = futures[fut]
                     try:
-                        shutil.copytree(env, dest)
-                        print(f"  Copied {env.name}")
+                        was_moved = fut.result()
+                        print(f"  {'Moved' if was_moved else 'Copied'} {env.name}")
+                        (moved if was_moved else copied).append(env)
                     except Exception as e:
-                        print(f"  Error copying {env.name}: {e}", file=sys.stderr)
+                        print(f"  Error migrating {env.name}: {e}", file=sys.stderr)
 
             print("\nMigration complete.")
-            response = input("Delete old environments? (y/n): ").strip().lower()
-            if response == 'y' or response == 'yes':
-                for env in environments_to_migrate:
-                    try:
-                        shutil.rmtree(env)
-                        print(f"  Deleted {env.name}")
-                    except Exception as e:
-                        print(f"  Error deleting {env.name}: {e}", file=sys.stderr)
+            if moved:
+                print(f"Moved {len(moved)} environment(s); the originals no longer exist in {current_dir}.")
+                print("Scripts in moved environments (pip, etc.) still point at the old location;")
+                print("recreate them with 'venvman create' or reinstall their packages.")
+            # Moved environments are already gone from the old location; only
+            # successful copies leave anything behind to delete
+            if copied and confirm("Delete old environments? (y/n): ", args.yes):
+                with ThreadPoolExecutor(max_workers=min(8, len(copied))) as ex:
+                    futures = {ex.submit(_parallel_rmtree, env): env for env in copied}
+                    for fut in as_completed(futures):
+                        env = futures[fut]
+                        try:
+                            fut.result()
+                            print(f"  Deleted {env.name}")
+                        except Exception as e:
+                            print(f"  Error deleting {env.name}: {e}", file=sys.stderr)
         else:
             print("Migration skipped.")
     else:
@@ -650,8 +1271,7 @@ def setenv(args):
 
     if not new_dir.exists():
         print(f"Directory does not exist: {new_dir}", file=sys.stderr)
-        response = input("Create it? (y/n): ").strip().lower()
-        if response == 'y' or response == 'yes':
+        if confirm("Create it? (y/n): "):
             new_dir.mkdir(parents=True, exist_ok=True)
             print(f"Created directory: {new_dir}")
         else:
@@ -685,15 +1305,13 @@ def bootstrap(args):
     Args:
         args: Parsed command-line arguments
     """
-    import re
-
     root = venv_home()
     if not root.exists():
         print(f"Virtual environment directory does not exist: {root}", file=sys.stderr)
         sys.exit(1)
 
     # Find all environment directories
-    env_dirs = [d for d in root.iterdir() if d.is_dir()]
+    env_dirs = [root / name for name in env_dir_names(root)]
     if not env_dirs:
         print(f"No environments found in {root}")
         return
@@ -707,7 +1325,7 @@ def bootstrap(args):
     for env_dir in sorted(env_dirs):
         # Parse environment name to extract project name
         # Expected format: <project>-py<version>
-        match = re.match(r'^(.+)-py(\d+\.\d+)$', env_dir.name)
+        match = _ENV_NAME_RE.match(env_dir.name)
         if match:
             project_name = match.group(1)
             venv_subdir = env_dir.name
@@ -758,7 +1376,7 @@ def update_projects(args):
     missing_count = 0
     no_path_count = 0
 
-    for project_name, info in sorted(projects.items()):
+    for project_name, info in projects.items():
         project_path_str = info.get("path")
         venv_subdir = info.get("venv_subdir")
 
@@ -767,9 +1385,10 @@ def update_projects(args):
             no_path_count += 1
             continue
 
-        project_path = Path(project_path_str)
+        # Plain str paths: this loop runs once per tracked project
+        project_path = os.path.normpath(project_path_str)
 
-        if not project_path.exists():
+        if not os.path.exists(project_path):
             print(f"  Warning: '{project_name}' not found at {project_path}")
             missing_count += 1
             continue
@@ -777,18 +1396,24 @@ def update_projects(args):
         print(f"Updating '{project_name}':")
         print(f"  Path: {project_path}")
 
-        # Remove .venv symlink if it exists
-        venv_link = project_path / ".venv"
-        if venv_link.is_symlink():
-            venv_link.unlink()
+        # Remove .venv symlink if it exists; one lstat covers both checks
+        venv_link = os.path.join(project_path, ".venv")
+        try:
+            is_link = stat.S_ISLNK(os.lstat(venv_link).st_mode)
+        except (FileNotFoundError, NotADirectoryError):
+            is_link = None
+        if is_link:
+            os.unlink(venv_link)
             print(f"  Removed .venv symlink")
-        elif venv_link.exists():
+        elif is_link is not None:
             print(f"  Warning: .venv exists but is not a symlink (not removed)")
 
         # Regenerate activate.sh
         if venv_subdir:
-            write_activate_sh(project_path, venv_subdir)
-            print(f"  Updated activate.sh")
+            if write_activate_sh(project_path, venv_subdir):
+                print(f"  Updated activate.sh")
+            else:
+                print(f"  activate.sh already up to date")
         else:
             print(f"  Warning: No venv_subdir set, skipping activate.sh")
 
@@ -835,8 +1460,7 @@ def addproject(args):
             print(f"Warning: Project '{project_name}' already exists with different path:")
             print(f"  Existing: {existing_path}")
             print(f"  New:      {project_path}")
-            response = input("Update path? (y/n): ").strip().lower()
-            if response != 'y' and response != 'yes':
+            if not confirm("Update path? (y/n): "):
                 print("Cancelled.")
                 sys.exit(0)
         # Update the path
@@ -848,19 +1472,16 @@ def addproject(args):
 
         if not venv_subdir:
             # Try to find an existing environment for this project
-            root = venv_home()
-            if root.exists():
-                pattern = f"{project_name}-py*"
-                matches = list(root.glob(pattern))
-                if len(matches) == 1:
-                    venv_subdir = matches[0].name
-                    print(f"Found existing environment: {venv_subdir}")
-                elif len(matches) > 1:
-                    print(f"Multiple environments found for '{project_name}':")
-                    for m in matches:
-                        print(f"  - {m.name}")
-                    print("Please specify --venv with the exact environment name.")
-                    sys.exit(1)
+            matches = _find_project_envs(venv_home(), project_name)
+            if len(matches) == 1:
+                venv_subdir = matches[0]
+                print(f"Found existing environment: {venv_subdir}")
+            elif len(matches) > 1:
+                print(f"Multiple environments found for '{project_name}':")
+                for name in matches:
+                    print(f"  - {name}")
+                print("Please specify --venv with the exact environment name.")
+                sys.exit(1)
 
         projects[project_name] = {
             "path": str(project_path),
@@ -874,8 +1495,10 @@ def addproject(args):
     # Regenerate activate.sh if we have venv_subdir
     venv_subdir = projects[project_name].get("venv_subdir")
     if venv_subdir:
-        write_activate_sh(project_path, venv_subdir)
-        print(f"Wrote {project_path / 'activate.sh'}")
+        if write_activate_sh(project_path, venv_subdir):
+            print(f"Wrote {project_path / 'activate.sh'}")
+        else:
+            print(f"{project_path / 'activate.sh'} is up to date")
 
         # Remove .venv symlink if it exists
         venv_link = project_path / ".venv"
@@ -895,24 +1518,20 @@ def removeproject(args):
     Args:
         args: Parsed command-line arguments
     """
-    projects = load_projects()
-
-    if args.project not in projects:
-        print(f"Error: Project '{args.project}' is not tracked.", file=sys.stderr)
-        print("\nCurrently tracked projects:")
-        if projects:
-            for name in sorted(projects.keys()):
-                print(f"  - {name}")
-        else:
-            print("  (none)")
-        sys.exit(1)
-
-    project_info = projects[args.project]
-    project_path = project_info.get("path", "(no path)")
-    venv_subdir = project_info.get("venv_subdir", "(no venv)")
+    with projects_transaction() as projects:
+        if args.project not in projects:
+            print(f"Error: Project '{args.project}' is not tracked.", file=sys.stderr)
+            print("\nCurrently tracked projects:")
+            if projects:
+                for name in projects:
+                    print(f"  - {name}")
+            else:
+                print("  (none)")
+            sys.exit(1)
 
-    del projects[args.project]
-    save_projects(projects)
+        project_info = projects.pop(args.project)
+        project_path = project_info.get("path", "(no path)")
+        venv_subdir = project_info.get("venv_subdir", "(no venv)")
 
     print(f"Removed project '{args.project}' from tracking")
     print(f"  Path was: {project_path}")
@@ -920,6 +1539,21 @@ def removeproject(args):
     print("\nNote: The virtual environment and project files were NOT deleted.")
 
 
+# listprojects checks paths from a thread pool once this many projects are tracked
+_PARALLEL_STAT_MIN = 32
+
+
+def _path_exists_fast(p: str | None) -> bool:
+    """Return True if p is set and exists, using a single stat call."""
+    if not p:
+        return False
+    try:
+        os.stat(p)
+        return True
+    except OSError:
+        return False
+
+
 def listprojects(args):
     """
     List all tracked projects.
@@ -934,32 +1568,50 @@ def listprojects(args):
         print("Use 'venvman create' or 'venvman addproject' to add projects.")
         return
 
-    print(f"Tracked projects ({len(projects)}):\n")
+    root = str(venv_home())
+    names = list(projects)
 
-    root = venv_home()
+    # Gather every path to check up front so the stats can be issued together
+    checks = []
+    for project_name in names:
+        info = projects[project_name]
+        project_path = info.get("path")
+        venv_subdir = info.get("venv_subdir")
+        checks.append(project_path or None)
+        checks.append(os.path.join(root, venv_subdir) if venv_subdir else None)
+
+    if len(names) >= _PARALLEL_STAT_MIN:
+        # Overlap stat latency on slow or network filesystems
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=16) as ex:
+            exists = list(ex.map(_path_exists_fast, checks))
+    else:
+        exists = [_path_exists_fast(p) for p in checks]
 
-    for project_name in sorted(projects.keys()):
+    out = [f"Tracked projects ({len(projects)}):\n\n"]
+    for i, project_name in enumerate(names):
         info = projects[project_name]
         project_path = info.get("path")
         venv_subdir = info.get("venv_subdir")
         last_deps = info.get("last_deps_install")
 
         # Check status
-        path_exists = project_path and Path(project_path).exists()
-        venv_exists = venv_subdir and (root / venv_subdir).exists()
+        path_exists = exists[2 * i]
+        venv_exists = exists[2 * i + 1]
 
         status = "ok" if (path_exists and venv_exists) else "!"
 
-        print(f"  [{status}] {project_name}")
-        print(f"      Path: {project_path or '(not set)'}")
-        print(f"      Venv: {venv_subdir or '(not set)'}")
+        out.append(f"  [{status}] {project_name}\n")
+        out.append(f"      Path: {project_path or '(not set)'}\n")
+        out.append(f"      Venv: {venv_subdir or '(not set)'}\n")
         if last_deps:
-            print(f"      Deps: {last_deps}")
+            out.append(f"      Deps: {format_timestamp(last_deps)}\n")
         if not path_exists and project_path:
-            print(f"      Warning: Project path not found")
+            out.append(f"      Warning: Project path not found\n")
         if not venv_exists and venv_subdir:
-            print(f"      Warning: Virtual environment not found")
-        print()
+            out.append(f"      Warning: Virtual environment not found\n")
+        out.append("\n")
+    sys.stdout.write("".join(out))
 
 
 def installdeps(args):
@@ -1026,18 +1678,19 @@ def installdeps(args):
     print()
 
     # Run pip install
-    r = run([str(pip_bin), "install", "-r", str(requirements_file)])
+    r = run_inherit([str(pip_bin), "install", *_PIP_INSTALL_OPTS, "-r", str(requirements_file)])
 
     if r.returncode == 0:
         print("\nSuccessfully installed dependencies")
 
-        # Update last_deps_install timestamp
-        projects[args.project]["last_deps_install"] = datetime.now().isoformat()
-        save_projects(projects)
+        # Update last_deps_install timestamp. Reload inside the transaction so
+        # changes made by other venvman runs during the install are kept.
+        with projects_transaction() as current:
+            if args.project in current:
+                current[args.project]["last_deps_install"] = time.time()
         print(f"Updated tracking for '{args.project}'")
     else:
-        print("\nFailed to install dependencies:", file=sys.stderr)
-        print(r.stderr, file=sys.stderr)
+        print("\nFailed to install dependencies", file=sys.stderr)
         sys.exit(1)
 
 
@@ -1051,14 +1704,135 @@ def help_cmd(args):
         print(f"Expected location: {readme_path}", file=sys.stderr)
         sys.exit(1)
 
+    import shutil
+
     try:
-        content = readme_path.read_text()
-        print(content)
+        # Copy the file straight to stdout without decoding it; sendfile does
+        # this inside the kernel where stdout supports it
+        sys.stdout.flush()
+        with open(readme_path, 'rb') as f:
+            offset = 0
+            size = os.fstat(f.fileno()).st_size
+            try:
+                out_fd = sys.stdout.fileno()
+                while offset < size:
+                    sent = os.sendfile(out_fd, f.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except (OSError, AttributeError):
+                f.seek(offset)
+                buffer = getattr(sys.stdout, "buffer", None)
+                if buffer is not None:
+                    shutil.copyfileobj(f, buffer, 64 * 1024)
+                    buffer.flush()
+                else:
+                    # Text-only stream such as io.StringIO (redirect_stdout)
+                    sys.stdout.write(f.read().decode())
     except Exception as e:
         print(f"Error reading README.md: {e}", file=sys.stderr)
         sys.exit(1)
 
 
+def _add_create_args(p):
+    """Arguments for the create command."""
+    p.add_argument("--project", required=True, help="Project name (used in env folder)")
+    p.add_argument("--python", help="Python version, e.g., 3.12")
+    p.add_argument("--dir", required=True, help="Project directory where activate.sh is placed")
+    p.add_argument("--force", action="store_true", help="Force overwrite of activate.sh")
+    p.add_argument("--install-deps", action="store_true", help="Install dependencies from requirements.txt or pyproject.toml")
+
+
+def _add_delete_args(p):
+    """Arguments for the delete command."""
+    delete_group = p.add_mutually_exclusive_group(required=True)
+    delete_group.add_argument("--project", help="Project name (deletes matching environment)")
+    delete_group.add_argument("--env", help="Exact environment name to delete")
+    p.add_argument("-y", "--yes", action="store_true", help="Skip the confirmation prompt")
+
+
+def _add_info_args(p):
+    """Arguments for the info command."""
+    info_group = p.add_mutually_exclusive_group(required=True)
+    info_group.add_argument("--project", help="Project name")
+    info_group.add_argument("--env", help="Exact environment name")
+
+
+def _add_set_home_args(p):
+    """Arguments for the set_home command (legacy, with migration)."""
+    p.add_argument("directory", help="New directory path for virtual environments")
+    p.add_argument("-y", "--yes", action="store_true",
+                   help="Migrate and delete old environments without prompting")
+    p.add_argument("--move", action="store_true",
+                   help="Rename environments on the same filesystem instead of copying them; "
+                        "the originals are removed without a prompt and their scripts must be "
+                        "regenerated")
+
+
+def _add_setenv_args(p):
+    """Arguments for the setenv command (simple, just sets the env var)."""
+    p.add_argument("directory", help="Directory path for virtual environments")
+
+
+def _add_addproject_args(p):
+    """Arguments for the addproject command."""
+    p.add_argument("directory", help="Path to project directory")
+    p.add_argument("--project", help="Project name (defaults to directory name)")
+    p.add_argument("--venv", help="Virtual environment subdirectory name")
+
+
+def _add_removeproject_args(p):
+    """Arguments for the removeproject command."""
+    p.add_argument("project", help="Project name to remove")
+
+
+def _add_installdeps_args(p):
+    """Arguments for the installdeps command."""
+    p.add_argument("--project", required=True, help="Project name")
+
+
+# (name, handler, help, add_args) for every subcommand, in usage order;
+# add_args is None for commands that take no options
+COMMANDS = (
+    ("list", list_envs, "List available environments under $VENVMAN_DIRECTORY", None),
+    ("create", create_env, "Create env and set up activate.sh in a project", _add_create_args),
+    ("delete", delete_env, "Delete a virtual environment", _add_delete_args),
+    ("info", info_env, "Display information about an environment", _add_info_args),
+    ("set_home", set_home, "Set the VENVMAN_DIRECTORY and migrate environments", _add_set_home_args),
+    ("setenv", setenv, "Set VIRTUAL_ENVIRONMENT_DIRECTORY in shell config", _add_setenv_args),
+    ("bootstrap", bootstrap, "Bootstrap project list from existing venv subdirectories", None),
+    ("update", update_projects, "Update activate.sh in all tracked projects", None),
+    ("addproject", addproject, "Add a project directory to tracking", _add_addproject_args),
+    ("removeproject", removeproject, "Remove a project from tracking", _add_removeproject_args),
+    ("listprojects", listprojects, "List all tracked projects", None),
+    ("installdeps", installdeps, "Install dependencies from requirements.txt", _add_installdeps_args),
+    ("help", help_cmd, "Display full README documentation", None),
+)
+
+_SUBCOMMANDS = {command[0]: command for command in COMMANDS}
+
+
+def _register(sub, command) -> None:
+    """Add one COMMANDS entry's parser to the subparsers action."""
+    name, handler, help_text, add_args = command
+    p = sub.add_parser(name, help=help_text)
+    if add_args is not None:
+        add_args(p)
+    p.set_defaults(func=handler)
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """Return the subcommand named by argv[1], or None if it is not one.
+
+    The top-level parser takes no options besides -h, so the subcommand is
+    always the first argument; later arguments may be values that happen
+    to match a command name (e.g. `venvman bogus list`).
+    """
+    if len(argv) > 1 and argv[1] in _SUBCOMMANDS:
+        return argv[1]
+    return None
+
+
 def main():
     """Main entry point for the venvman CLI."""
     parser = argparse.ArgumentParser(
@@ -1066,75 +1840,15 @@ def main():
     )
     sub = parser.add_subparsers(dest="cmd", required=True)
 
-    # List environments command
-    p_list = sub.add_parser("list", help="List available environments under $VENVMAN_DIRECTORY")
-    p_list.set_defaults(func=list_envs)
-
-    # Create command
-    p_create = sub.add_parser("create", help="Create env and set up activate.sh in a project")
-    p_create.add_argument("--project", required=True, help="Project name (used in env folder)")
-    p_create.add_argument("--python", help="Python version, e.g., 3.12")
-    p_create.add_argument("--dir", required=True, help="Project directory where activate.sh is placed")
-    p_create.add_argument("--force", action="store_true", help="Force overwrite of activate.sh")
-    p_create.add_argument("--install-deps", action="store_true", help="Install dependencies from requirements.txt or pyproject.toml")
-    p_create.set_defaults(func=create_env)
-
-    # Delete command
-    p_delete = sub.add_parser("delete", help="Delete a virtual environment")
-    delete_group = p_delete.add_mutually_exclusive_group(required=True)
-    delete_group.add_argument("--project", help="Project name (deletes matching environment)")
-    delete_group.add_argument("--env", help="Exact environment name to delete")
-    p_delete.set_defaults(func=delete_env)
-
-    # Info command
-    p_info = sub.add_parser("info", help="Display information about an environment")
-    info_group = p_info.add_mutually_exclusive_group(required=True)
-    info_group.add_argument("--project", help="Project name")
-    info_group.add_argument("--env", help="Exact environment name")
-    p_info.set_defaults(func=info_env)
-
-    # Set home command (legacy, with migration)
-    p_set_home = sub.add_parser("set_home", help="Set the VENVMAN_DIRECTORY and migrate environments")
-    p_set_home.add_argument("directory", help="New directory path for virtual environments")
-    p_set_home.set_defaults(func=set_home)
-
-    # Setenv command (simple, just sets the env var)
-    p_setenv = sub.add_parser("setenv", help="Set VIRTUAL_ENVIRONMENT_DIRECTORY in shell config")
-    p_setenv.add_argument("directory", help="Directory path for virtual environments")
-    p_setenv.set_defaults(func=setenv)
-
-    # Bootstrap command
-    p_bootstrap = sub.add_parser("bootstrap", help="Bootstrap project list from existing venv subdirectories")
-    p_bootstrap.set_defaults(func=bootstrap)
-
-    # Update command
-    p_update = sub.add_parser("update", help="Update activate.sh in all tracked projects")
-    p_update.set_defaults(func=update_projects)
-
-    # Add project command
-    p_addproject = sub.add_parser("addproject", help="Add a project directory to tracking")
-    p_addproject.add_argument("directory", help="Path to project directory")
-    p_addproject.add_argument("--project", help="Project name (defaults to directory name)")
-    p_addproject.add_argument("--venv", help="Virtual environment subdirectory name")
-    p_addproject.set_defaults(func=addproject)
-
-    # Remove project command
-    p_removeproject = sub.add_parser("removeproject", help="Remove a project from tracking")
-    p_removeproject.add_argument("project", help="Project name to remove")
-    p_removeproject.set_defaults(func=removeproject)
-
-    # List projects command
-    p_listprojects = sub.add_parser("listprojects", help="List all tracked projects")
-    p_listprojects.set_defaults(func=listprojects)
-
-    # Install dependencies command
-    p_installdeps = sub.add_parser("installdeps", help="Install dependencies from requirements.txt")
-    p_installdeps.add_argument("--project", required=True, help="Project name")
-    p_installdeps.set_defaults(func=installdeps)
-
-    # Help command
-    p_help = sub.add_parser("help", help="Display full README documentation")
-    p_help.set_defaults(func=help_cmd)
+    # Only build the invoked subcommand's parser. Help requests and unknown
+    # commands get the full parser so usage and "invalid choice" errors list
+    # every subcommand.
+    cmd = _sniff_subcommand(sys.argv)
+    if cmd is not None and "-h" not in sys.argv and "--help" not in sys.argv:
+        _register(sub, _SUBCOMMANDS[cmd])
+    else:
+        for command in COMMANDS:
+            _register(sub, command)
 
     args = parser.parse_args()
     args.func(args)